@@ -120,6 +120,7 @@ class Session(_build.Master):
     self._build_directory = nr.fs.canonical(build_directory)
     self._build_variant = build_variant
     self._current_scopes = []
+    self._current_scope = None
     self.graph_filename = nr.fs.join(build_root, 'craftr_graph.{}.json'.format(build_variant))
     self.cli_options = cli_options
     self.options = {}
@@ -135,6 +136,12 @@ class Session(_build.Master):
     self.os_info = OsInfo.new()
     self.build_info = BuildInfo(self._build_variant)
     self.main_module = None
+    # Incremented whenever a dependency between targets is added or
+    # changed, invalidating cached transitive dependencies.
+    self._dependency_version = 0
+    # Incremented whenever a target property is set, invalidating cached
+    # inherited property values.
+    self._property_version = 0
     Target.init_properties(self.target_props)
 
   def add_module_search_path(self, path):
@@ -171,11 +178,7 @@ class Session(_build.Master):
     """
 
     if isinstance(config, str):
-      with open(config) as fp:
-        if path.getsuffix(config) == 'json':
-          config = json.load(fp)
-        else:
-          config = toml.load(fp)
+      config = self._read_config_file(config)
 
     def handle_key(key, data):
       if key.startswith('if(') and key.endswith(')'):
@@ -193,6 +196,42 @@ class Session(_build.Master):
     for key, value in config.items():
       handle_key(key, value)
 
+  def _read_config_file(self, filename):
+    """
+    Parses the JSON or TOML configuration file *filename*. The configuration
+    is read on every invocation but rarely changes, thus parsed TOML files
+    are cached in the build root keyed by their modification time and size.
+    """
+
+    if path.getsuffix(filename) == 'json':
+      with open(filename) as fp:
+        return json.load(fp)
+
+    st = os.stat(filename)
+    key = nr.fs.canonical(filename)
+    stamp = [st.st_mtime_ns, st.st_size]
+    cache_file = nr.fs.join(self._build_root, 'craftr_config_cache.json')
+    try:
+      with open(cache_file) as fp:
+        cache = json.load(fp)
+    except (OSError, ValueError):
+      cache = {}
+    entry = cache.get(key)
+    if entry and entry['stamp'] == stamp:
+      return entry['data']
+
+    with open(filename) as fp:
+      data = toml.load(fp)
+    cache[key] = {'stamp': stamp, 'data': data}
+    try:
+      cache_data = json.dumps(cache)
+    except TypeError:
+      return data  # eg. TOML datetimes can not be represented in JSON
+    nr.fs.makedirs(self._build_root)
+    with open(cache_file, 'w') as fp:
+      fp.write(cache_data)
+    return data
+
   def load_module(self, name):
     return self.require(name, exports=False)
 
@@ -225,20 +264,21 @@ class Session(_build.Master):
   def enter_scope(self, name, version, directory):
     scope = Scope(self, name, version, directory)
     self._current_scopes.append(scope)
+    self._current_scope = scope
     try: yield scope
     finally:
       finalize_target()
       assert self._current_scopes.pop() is scope
+      self._current_scope = self._current_scopes[-1] if self._current_scopes else None
 
   @property
   def current_scope(self):
-    return self._current_scopes[-1] if self._current_scopes else None
+    return self._current_scope
 
   @property
   def current_target(self):
-    if self._current_scopes:
-      return self._current_scopes[-1].current_target
-    return None
+    scope = self._current_scope
+    return scope.current_target if scope is not None else None
 
   def reload(self):
     super().__init__()
@@ -280,6 +320,9 @@ class Scope:
   scope must be initialized with the #module_id() build script function.
   """
 
+  __slots__ = ('session', 'name', 'version', 'directory', 'current_target',
+               'targets')
+
   def __init__(self, session: Session, name: str, version: str, directory: str):
     self.session = session
     self.name = name
@@ -306,13 +349,31 @@ class Target(_build.Target):
     props.add('this.buildDirectory', 'String', None)
 
   class Dependency:
+    __slots__ = ('target', 'public', '_owner', '_properties')
     def __init__(self, target, public):
       self.target = target
       self.public = public
-      self.properties = Properties(session.dependency_props, owner=current_scope())
+      self._owner = current_scope()
+      self._properties = None
+    @property
+    def properties(self):
+      # Most dependencies never have properties set, so we only create
+      # the container when it is first accessed.
+      if self._properties is None:
+        self._properties = Properties(session.dependency_props, owner=self._owner)
+      return self._properties
     def __getitem__(self, key):
       return self.properties[key]
 
+  class TrackedProperties(Properties):
+    """
+    Bumps the session's property version when a value is set.
+    """
+
+    def __setitem__(self, key, value):
+      super().__setitem__(key, value)
+      session._property_version += 1
+
   @nr.interface.implements(proplib.Path.OwnerInterface)
   class PropertiesOwner(object):
 
@@ -324,15 +385,18 @@ class Target(_build.Target):
       return self._target.directory
 
   def __init__(self, name: str, scope:Scope):
-    super().__init__(session, '{}@{}'.format(scope.name, name))
+    super().__init__(session, sys.intern('{}@{}'.format(scope.name, name)))
     self.name = name
     self.scope = scope
     self.current_operator = None
     self.finalizers = []
     self.finalized = False
-    self.properties = Properties(session.target_props, owner=Target.PropertiesOwner(self))
-    self.public_properties = Properties(session.target_props, owner=Target.PropertiesOwner(self))
-    self._dependencies = []
+    self.properties = Target.TrackedProperties(session.target_props, owner=Target.PropertiesOwner(self))
+    self.public_properties = Target.TrackedProperties(session.target_props, owner=Target.PropertiesOwner(self))
+    self._dependencies = ()
+    self._dependency_map = {}
+    self._transitive_cache = None
+    self._inherit_cache = {}
     self._operator_name_counter = collections.defaultdict(lambda: 1)
 
   def __getitem__(self, prop_name):
@@ -341,8 +405,7 @@ class Target(_build.Target):
     """
 
     prop = self.properties.propset[prop_name]
-    inherit = prop.options.get('inherit', False)
-    return self.get_prop(prop_name, inherit=inherit)
+    return self.get_prop(prop_name, inherit=prop.inherit)
 
   def __setitem__(self, prop_name, value):
     """
@@ -358,7 +421,10 @@ class Target(_build.Target):
       elif not append and prop_name[0] == '+': append, prop_name = True, prop_name[1:]
       elif not append and prop_name[-1] == '+': append, prop_name = True, prop_name[:-1]
       else: break
+    self._set_prop(prop_name, value, public, append)
 
+  def _set_prop(self, prop_name, value, public, append):
+    prop_name = sys.intern(prop_name)
     dest = self.public_properties if public else self.properties
     if append and dest.is_set(prop_name):
       prop = dest.propset[prop_name]
@@ -385,7 +451,9 @@ class Target(_build.Target):
 
   @property
   def dependencies(self):
-    return list(self._dependencies)
+    # The tuple is replaced rather than modified in add_dependency(), so
+    # it can be handed out without a copy.
+    return self._dependencies
 
   def add_dependency(self, target: 'Target', public: bool, do_raise: bool = False):
     """
@@ -401,15 +469,19 @@ class Target(_build.Target):
       raise TypeError('expected Target, got {}'.format(
         type(target).__name__))
 
-    for x in self._dependencies:
-      if x.target is target:
-        if do_raise:
-          raise RuntimeError('dependency to "{}" already exists'.format(target.id))
-        x.public = x.public or public
-        return x
+    x = self._dependency_map.get(target)
+    if x is not None:
+      if do_raise:
+        raise RuntimeError('dependency to "{}" already exists'.format(target.id))
+      if public and not x.public:
+        x.public = True
+        session._dependency_version += 1
+      return x
 
     dep = Target.Dependency(target, public)
-    self._dependencies.append(dep)
+    self._dependencies += (dep,)
+    self._dependency_map[target] = dep
+    session._dependency_version += 1
     return dep
 
   def get_prop(self, prop_name, inherit=False, default=NotImplemented):
@@ -428,19 +500,17 @@ class Target(_build.Target):
     """
 
     if inherit:
-      def iter_values():
-        if self.public_properties.is_set(prop_name):
-          yield self.public_properties[prop_name]
-        if self.properties.is_set(prop_name):
-          yield self.properties[prop_name]
-        for target in self.transitive_dependencies().attr('target'):
-          if target.public_properties.is_set(prop_name):
-            yield target.public_properties[prop_name]
-      prop = self.properties.propset[prop_name]
-      try:
-        return prop.type.inherit(prop_name, iter_values())
-      except StopIteration:
-        return prop.get_default(self.properties.owner)
+      # Inherited values are cached until a dependency or property changes.
+      # Mutable values are copied so that callers can't modify the cache.
+      version = (session._dependency_version, session._property_version)
+      cached = self._inherit_cache.get(prop_name)
+      if cached is None or cached[0] != version:
+        cached = (version, self._get_inherited_prop(prop_name))
+        self._inherit_cache[prop_name] = cached
+      value = cached[1]
+      if isinstance(value, (list, dict)):
+        value = type(value)(value)
+      return value
     else:
       if self.public_properties.is_set(prop_name):
         return self.public_properties[prop_name]
@@ -451,6 +521,21 @@ class Target(_build.Target):
       else:
         return default
 
+  def _get_inherited_prop(self, prop_name):
+    def iter_values():
+      if self.public_properties.is_set(prop_name):
+        yield self.public_properties[prop_name]
+      if self.properties.is_set(prop_name):
+        yield self.properties[prop_name]
+      for dep in self._get_transitive_dependencies():
+        if dep.target.public_properties.is_set(prop_name):
+          yield dep.target.public_properties[prop_name]
+    prop = self.properties.propset[prop_name]
+    try:
+      return prop.type.inherit(prop_name, iter_values())
+    except StopIteration:
+      return prop.get_default(self.properties.owner)
+
   def get_props(self, prefix='', as_object=False):
     """
     Creates a dictionary from all property values in the Target that start
@@ -483,13 +568,35 @@ class Target(_build.Target):
     will be contained in the stream.
     """
 
-    def worker(target, include_private=False):
-      for dep in target.dependencies:
-        if dep.public or include_private:
-          yield dep
-        yield from worker(dep.target)
-    it = worker(self, include_private=True)
-    return stream.unique(it, key=lambda d: d.target)
+    return stream(self._get_transitive_dependencies())
+
+  def _get_transitive_dependencies(self):
+    version = session._dependency_version
+    if self._transitive_cache and self._transitive_cache[0] == version:
+      return self._transitive_cache[1]
+
+    # Depth-first walk with an explicit stack of dependency iterators. Only
+    # the private dependencies of this target are included. Every target's
+    # dependencies need to be expanded only once, all the dependencies found
+    # through another expansion would be duplicates.
+    result = []
+    seen = set()
+    expanded = {self}
+    stack = [(iter(self._dependencies), True)]
+    while stack:
+      dep = next(stack[-1][0], None)
+      if dep is None:
+        stack.pop()
+        continue
+      if (dep.public or stack[-1][1]) and dep.target not in seen:
+        seen.add(dep.target)
+        result.append(dep)
+      if dep.target not in expanded:
+        expanded.add(dep.target)
+        stack.append((iter(dep.target._dependencies), False))
+
+    self._transitive_cache = (version, result)
+    return result
 
 
 class Operator(_build.Operator):
@@ -504,6 +611,8 @@ class Operator(_build.Operator):
 
 class BuildSet(_build.BuildSet):
 
+  __slots__ = ()
+
   def __init__(self, inputs, outputs, variables=None, *args, **kwargs):
     super().__init__(session, *args, **kwargs)
     self.variables.update(variables or {})
@@ -546,9 +655,12 @@ def current_scope(do_raise=True):
 
 
 def current_target(do_raise=True):
-  scope = current_scope(do_raise)
-  target = scope and scope.current_target
+  # A target can only be bound in an initialized scope, so the scope
+  # checks are only needed to report a proper error.
+  scope = session._current_scope
+  target = scope.current_target if scope is not None else None
   if do_raise and target is None:
+    current_scope()
     raise RuntimeError('no current target')
   return target
 
@@ -618,6 +730,9 @@ def config(toml_str):
   session.options.update(toml.loads(toml_str))
 
 
+_PROJECT_CALL_REGEX = re.compile(r'^project\((.*?)\)', re.M | re.X)
+
+
 def link_module(path, alias=None):
   """
   This function can be used in a build script that uses a Craftr module from
@@ -629,9 +744,8 @@ def link_module(path, alias=None):
   path = nr.fs.canonical(path)
   module = session.nodepy_context.require.resolve(path)
   if alias is None:
-    expr = re.compile(r'^project\((.*?)\)', re.M | re.X)
     with module.filename.open() as fp:
-      match = expr.search(fp.read())
+      match = _PROJECT_CALL_REGEX.search(fp.read())
       if not match:
         raise ValueError('could not find project name in "{}"'.format(path))
       expr = 'project = lambda name, version: (name, version)\nname, version = project({})'
@@ -827,33 +941,20 @@ def properties(*args, target=None, **kwarg_props):
   else:
     scope += '.'
 
-  compiled_props = {}
-
-  # Prepare the parameters from both sources.
-  for key, value in (props or {}).items():
+  for key, value in props.items():
     public = append = False
     while True:
       if not public and key[0] == '@': public, key = True, key[1:]
       elif not append and key[0] == '+': append, key = True, key[1:]
       elif not append and key[-1] == '+': append, key = True, key[:-1]
       else: break
-    compiled_props.setdefault(key, []).append((value, public, append))
+    target._set_prop(scope + key, value, public, append)
   for key, value in kwarg_props.items():
     public = key.startswith('public__')
     if public: key = key[8:]
     append = key.endswith('__append')
     if append: key = key[:-8]
-    compiled_props.setdefault(key, []).append((value, public, append))
-
-  for key, operations in compiled_props.items():
-    key = scope + key
-    for value, public, append in operations:
-      c_key = key
-      if public:
-        c_key = '@' + key
-      if append:
-        c_key += '+'
-      target[c_key] = value
+    target._set_prop(scope + key, value, public, append)
 
 
 def operator(name, commands, variables=None, target=None, bind=None, **kwargs):
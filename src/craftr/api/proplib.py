@@ -30,8 +30,9 @@ from nr import fs as path
 from nr.collections.generic import GenericMeta
 
 import builtins
-import collections
+import collections.abc
 import nr.interface
+import sys
 
 
 class Prop:
@@ -50,6 +51,7 @@ class Prop:
     self.optional = optional
     self.readonly = readonly
     self.options = options or {}
+    self.inherit = self.options.get('inherit', False)
 
   def __repr__(self):
     return 'Prop(name={!r}, type={!r}, default={!r}, optional={!r}, readonly={!r})'.format(
@@ -82,6 +84,16 @@ class PropType:
     """
     raise NotImplementedError
 
+  def coerce_items(self, name, values, owner=None):
+    """
+    Coerces every item in the list *values*. Called by #List.coerce().
+    Subclasses can override this method to resolve state that is shared
+    by all items only once.
+    """
+
+    return [self.coerce(name + '[' + str(i) + ']', x, owner)
+            for i, x in enumerate(values)]
+
   def default(self):
     raise NotImplementedError
 
@@ -165,7 +177,7 @@ class Path(String):
   def __init__(self, parent_dir_getter=None):
     self.parent_dir_getter = parent_dir_getter
 
-  def coerce(self, name, value, owner=None):
+  def get_parent_dir(self, owner):
     if self.parent_dir_getter:
       parent_dir = self.parent_dir_getter(owner)
     else:
@@ -176,8 +188,21 @@ class Path(String):
                            'implement Path.OwnerInterface'.format(
                              type(owner).__name__))
       parent_dir = owner.path_get_parent_dir()
+    return path.abs(parent_dir)
+
+  def coerce(self, name, value, owner=None):
+    parent_dir = self.get_parent_dir(owner)
     value = super().coerce(name, value, owner)
-    return path.canonical(value, path.abs(parent_dir))
+    return path.canonical(value, parent_dir)
+
+  def coerce_items(self, name, values, owner=None):
+    if not values:
+      return []
+    parent_dir = self.get_parent_dir(owner)
+    check = super().coerce
+    canonical = path.canonical
+    return [canonical(check(name + '[' + str(i) + ']', x, owner), parent_dir)
+            for i, x in enumerate(values)]
 
 
 class List(PropType, metaclass=GenericMeta):
@@ -199,8 +224,7 @@ class List(PropType, metaclass=GenericMeta):
     elif not isinstance(value, list):
       raise self.typeerror(name, 'list', value)
     if self.item_type:
-      value = [self.item_type.coerce(name + '[' + str(i) + ']', x, owner)
-               for i, x in enumerate(value)]
+      value = self.item_type.coerce_items(name, value, owner)
     return value
 
   def default(self):
@@ -208,10 +232,11 @@ class List(PropType, metaclass=GenericMeta):
 
   def inherit(self, name, values):
     result = []
+    extend = result.extend
     for i, item in enumerate(values):
-      if not isinstance(values, (tuple, list, collections.Iterable)):
-        raise self.typeerror(name + '[{}]'.format(i), 'tuple,list', values)
-      result += item
+      if not isinstance(item, collections.abc.Iterable):
+        raise self.typeerror(name + '[{}]'.format(i), 'tuple,list', item)
+      extend(item)
     return result
 
 
@@ -337,6 +362,7 @@ class PropertySet:
   def add(self, prop_name, *args, **kwargs):
     if prop_name in self.props:
       raise ValueError('property name already used: {!r}'.format(prop_name))
+    prop_name = sys.intern(prop_name)
     prop = Prop(prop_name, *args, **kwargs)
     self.props[prop_name] = prop
     return prop
@@ -35,6 +35,7 @@ __all__ = ['BuildSet', 'Commands', 'Operator', 'Target', 'Master']
 
 import collections
 import contextlib
+import functools
 import hashlib
 import io
 import json
@@ -43,6 +44,10 @@ import nr.fs
 import re
 import shlex
 import subprocess
+import sys
+
+try: import orjson
+except ImportError: orjson = None
 
 from craftr.utils.maps import ValueIterableDict
 from nr.collections import ChainDict
@@ -60,6 +65,10 @@ class BuildSet:
   This is done automatically when adding files to the set.
   """
 
+  __slots__ = ('_master', 'description', '_environ', '_cwd', 'depfile',
+               '_inputs', '_outputs', '_variables', '_operator',
+               'additional_args')
+
   def __init__(self, master: 'Master', description: str = None,
                environ: Dict[str, str] = None, cwd: str = None,
                depfile: str = None):
@@ -133,11 +142,13 @@ class BuildSet:
     return result
 
   def get_input_build_sets(self) -> set:
+    output_files = self._master._output_files
     inputs = set()
-    for fname in stream.concat(self.inputs.values()):
-      bset = self._master._output_files.get(fname, None)
-      if bset is not None:
-        inputs.add(bset)
+    for files in self._inputs.values():
+      for fname in files:
+        bset = output_files.get(fname)
+        if bset is not None:
+          inputs.add(bset)
     return inputs
 
   def get_commands(self):
@@ -185,8 +196,10 @@ class BuildSet:
     self._environ = data['environ']
     self._cwd = data['cwd']
     self.depfile = data['depfile']
-    self._inputs = data['inputs']
-    self._outputs = data['outputs']
+    # The same filenames appear as outputs of one build set and inputs of
+    # others, intern them so the loaded graph shares the string objects.
+    self._inputs = {k: [sys.intern(x) for x in v] for k, v in data['inputs'].items()}
+    self._outputs = {k: [sys.intern(x) for x in v] for k, v in data['outputs'].items()}
     self._variables = data['variables']
     self._operator = operator
     self.additional_args = None
@@ -205,20 +218,36 @@ class BuildSet:
     return hashlib.sha1(json.dumps(data, sort_keys=True).encode('utf8')).hexdigest()
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_command(command):
+  """
+  Compiles the *command* (a tuple of strings) and returns the compiled
+  template along with the input and output file sets and the variables that
+  it references. Most operators are created from the same few command
+  templates, thus the result is cached. It must not be modified.
+  """
+
+  compiled = TemplateCompiler().compile_list(command)
+  inputs, outputs, variables = compiled.occurences(set(), set(), set())
+  return compiled, frozenset(inputs), frozenset(outputs), frozenset(variables)
+
+
 class Command:
   """
   Represents a single command.
   """
 
+  __slots__ = ('_command', '_compiled', '_inputs', '_outputs', '_variables',
+               '_supports_response_file', '_response_args_begin')
+
   def __init__(self, command: Union[List[str], str],
                supports_response_file: bool = False,
                response_args_begin: int = 1):
     if isinstance(command, str):
       command = shlex.split(command)
     self._command = command
-    self._compiled = TemplateCompiler().compile_list(command)
-    self._inputs, self._outputs, self._variables = \
-        self._compiled.occurences(set(), set(), set())
+    self._compiled, self._inputs, self._outputs, self._variables = \
+        _compile_command(tuple(command))
     self._supports_response_file = supports_response_file
     self._response_args_begin = response_args_begin
 
@@ -302,6 +331,8 @@ class Commands:
   A commands object is immutable after construction.
   """
 
+  __slots__ = ('_commands', '_inputs', '_outputs', '_variables')
+
   def __init__(self, commands: List[Union[Command, List[str]]]):
     self._commands = []
     for x in commands:
@@ -309,8 +340,10 @@ class Commands:
         x = Command(x)
       self._commands.append(x)
     self._inputs, self._outputs, self._variables = set(), set(), set()
-    [x.compiled.occurences(self._inputs, self._outputs, self._variables)
-     for x in self._commands]
+    for x in self._commands:
+      self._inputs.update(x.inputs)
+      self._outputs.update(x.outputs)
+      self._variables.update(x.variables)
 
   def __repr__(self):
     return 'Commands({!r})'.format(self._commands)
@@ -445,12 +478,13 @@ class Operator:
     return self._build_sets[:]
 
   def add_build_set(self, build_set):
-    if build_set._operator is None:
-      build_set._operator = self
-    if build_set._operator is not self:
-      raise ValueError('add_build_set(): BuildSet belongs to another Operator')
-    if build_set in self._build_sets:
-      raise RuntimeError('add_build_set(): BuildSet is already added')
+    # A build set is bound to the operator when it is added, so the linear
+    # membership test is only needed if it is already bound to this one.
+    if build_set._operator is not None:
+      if build_set._operator is not self:
+        raise ValueError('add_build_set(): BuildSet belongs to another Operator')
+      if build_set in self._build_sets:
+        raise RuntimeError('add_build_set(): BuildSet is already added')
     for set_name in self._commands.inputs:
       if set_name not in build_set.inputs:
         raise RuntimeError('operator requires ${{<{}}} which is not '
@@ -466,6 +500,7 @@ class Operator:
     if build_set.depfile and self.deps_prefix:
       raise RuntimeError('incompatible BuildSet: BuildSet.depsprefix can not '
                          'be used when Operator.deps_prefix is set.')
+    build_set._operator = self
     self._build_sets.append(build_set)
     return build_set
 
@@ -483,7 +518,7 @@ class Operator:
     self = object.__new__(cls)
     self._master = master
     self._target = target
-    self._name = data['name']
+    self._name = sys.intern(data['name'])
     self._commands = Commands.from_json(data['commands'])
     self._build_sets = [BuildSet.from_json(master, self, x) for x in data['build_sets']]
     self._variables = data['variables']
@@ -550,7 +585,7 @@ class Target:
   def from_json(cls, master: 'Master', data: Dict) -> 'Target':
     self = object.__new__(cls)
     self._master = master
-    self._id = data['id']
+    self._id = sys.intern(data['id'])
     self._operators = {x['name']: Operator.from_json(master, self, x)
                        for x in data['operators']}
     return self
@@ -594,8 +629,10 @@ class Master:
     return target
 
   def _declare_output(self, build_set:BuildSet, filename:str):
-    # Note: filename must be canonicalized
-    assert self.canonicalize_path(filename) == filename
+    # Note: filename must be canonicalized. This is not checked here as
+    # it is called for every output file, and both callers (adding files
+    # to a build set and loading the serialized graph) already pass
+    # canonical paths.
     if filename in self._output_files:
       raise ValueError(
         'Two build sets with the same output file can not co-exist.\n'
@@ -618,12 +655,28 @@ class Master:
     self._targets = {x['id']: Target.from_json(self, x) for x in data}
 
   def save(self, filename: str):
-    with open(filename, 'w') as fp:
-      json.dump(self.to_json(), fp, sort_keys=True)
+    if orjson:
+      data = orjson.dumps(self.to_json(), option=orjson.OPT_SORT_KEYS)
+    else:
+      data = json.dumps(self.to_json(), sort_keys=True).encode('utf8')
+    # Leave the file and its modification time untouched if the build
+    # graph did not change.
+    try:
+      with open(filename, 'rb') as fp:
+        if fp.read() == data:
+          return
+    except FileNotFoundError:
+      pass
+    with open(filename, 'wb') as fp:
+      fp.write(data)
 
   def load(self, filename: str):
-    with open(filename) as fp:
-      data = json.load(fp)
+    if orjson:
+      with open(filename, 'rb') as fp:
+        data = orjson.loads(fp.read())
+    else:
+      with open(filename) as fp:
+        data = json.load(fp)
     self.load_json(data)
 
 
@@ -728,7 +781,9 @@ def topo_sort(build_sets: Union[Master, List[BuildSet]]):
     if not bset_inputs[bset]:
       bset_start.add(bset)
     else:
-      queue += bset_inputs[bset]
+      # Only enqueue build sets that have not been visited, otherwise shared
+      # inputs are pushed once for every build set that depends on them.
+      queue.extend(x for x in bset_inputs[bset] if x not in bset_inputs)
 
   while bset_start:
     bset = bset_start.pop()
@@ -738,3 +793,28 @@ def topo_sort(build_sets: Union[Master, List[BuildSet]]):
       if not bset_inputs[x]:
         bset_start.add(x)
     bset_reverse[bset] = set()
+
+
+def critical_path(build_sets: Union[Master, List[BuildSet]], cost=None):
+  """
+  Computes the critical path length of every build set in *build_sets*,
+  that is the cost of the build set plus the longest chain of build sets
+  that depend on it. The cost of a build set is determined by calling
+  *cost* with the build set as the argument and defaults to 1.
+
+  Returns a dictionary that maps every build set to its critical path
+  length. Starting the build sets with the longest critical path first
+  keeps parallel builds from stalling on a long chain at the end.
+  """
+
+  order = list(topo_sort(build_sets))
+  bset_reverse = {}
+  for bset in order:
+    for x in bset.get_input_build_sets():
+      bset_reverse.setdefault(x, []).append(bset)
+
+  result = {}
+  for bset in reversed(order):
+    value = cost(bset) if cost else 1
+    result[bset] = value + max((result[x] for x in bset_reverse.get(bset, ())), default=0)
+  return result
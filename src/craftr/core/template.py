@@ -37,10 +37,9 @@ list of values, however that can only be determined at render time.
 
 __all__ = ['TemplateCompiler']
 
-import collections
+import collections.abc
 import re
 
-from nr.stream import Stream as stream
 from nr.sumtype import Constructor, Sumtype, add_constructor_tests
 from typing import List
 
@@ -81,6 +80,13 @@ class _Template:
                        'allowed, got [{}]'.format(names))
     self._has_file_set = len(file_sets) != 0
 
+    # Templates without any references render to the same string every
+    # time, which is the case for the majority of command arguments.
+    if all(x.is_str() for x in self._parts):
+      self._static = ''.join(str(x.val) for x in self._parts)
+    else:
+      self._static = None
+
   def __str__(self):
     return ''.join(x.to_str() for x in self._parts)
 
@@ -99,6 +105,8 @@ class _Template:
     return [x for x in self._parts if x.is_var()]
 
   def render(self, inputs, outputs, variables, safe=False):
+    if self._static is not None:
+      return [self._static]
     prefix = ''
     expandable = None
     suffix = ''
@@ -108,7 +116,7 @@ class _Template:
           value = variables.get(x.name, '')
         else:
           value = variables[x.name]
-        is_seq = isinstance(value, collections.Sequence) and \
+        is_seq = isinstance(value, collections.abc.Sequence) and \
                  not isinstance(value, str)
         if is_seq and self._has_file_set:
           raise ValueError('variable {} can not be expanded as it contains '
@@ -159,10 +167,12 @@ class _TemplateList:
     self._concat = concat
 
   def render(self, inputs, outputs, variables, safe=False):
-    items = (x.render(inputs, outputs, variables, safe) for x in self._templates)
-    if self._concat:
-      items = stream.concat(items)
-    return list(items)
+    if not self._concat:
+      return [x.render(inputs, outputs, variables, safe) for x in self._templates]
+    result = []
+    for x in self._templates:
+      result.extend(x.render(inputs, outputs, variables, safe))
+    return result
 
   def occurences(self, inputs, outputs, variables):
     for x in self._templates:
@@ -9,13 +9,7 @@ import subprocess
 import sys
 import warnings
 
-try: import ntfy
-except ImportError: ntfy = None
-
 from craftr import api
-from craftr.core.build import to_graph
-from nr.stream import groupby
-from termcolor import colored
 
 if sys.version_info[0] != 3:
   raise RuntimeError('Python 3 is required to run Craftr.')
@@ -38,7 +32,18 @@ def open_cli_file(filename, mode):
       yield fp
 
 
+def import_ntfy():
+  # Imported on demand, the ntfy module is slow to import and only
+  # needed with --notify.
+  try:
+    import ntfy
+  except ImportError:
+    return None
+  return ntfy
+
+
 def notify(message, title):
+  ntfy = import_ntfy()
   if not ntfy:
     return
   # On OSX, even if a virtualenv is created with --system-site-packages
@@ -50,6 +55,21 @@ def notify(message, title):
     ntfy.notify(message, title)
 
 
+def parse_target_specifier(spec, default_scope):
+  """
+  Parses a target specifier of the form `[<scope>@]<target>[:<operator>]`
+  and returns a tuple of `(scope, target, operator)`. The *operator* is
+  #None if it is not specified in *spec*.
+  """
+
+  start = spec.find('@') + 1
+  scope = spec[:start - 1] if start else default_scope
+  colon = spec.find(':', start)
+  if colon < 0:
+    return scope, spec[start:], None
+  return scope, spec[start:colon], spec[colon + 1:]
+
+
 def resolve_build_sets(session, target_specifiers):
   """
   Returns a list of the build sets that are defined in the list of
@@ -65,10 +85,19 @@ def resolve_build_sets(session, target_specifiers):
   dirty.
   """
 
-  basename_map = {}
-  for k, v in session._output_files.items():
-    base = nr.fs.base(k).lower()
-    basename_map.setdefault(base, set()).add(v)
+  # Built on first use, resolving paths or target names with a path
+  # separator does not require a map of all output files.
+  basename_map = None
+  def find_by_basename(spec):
+    nonlocal basename_map
+    if '/' in spec or os.sep in spec:
+      return None
+    if basename_map is None:
+      basename_map = {}
+      for k, v in session._output_files.items():
+        base = nr.fs.base(k).lower()
+        basename_map.setdefault(base, set()).add(v)
+    return basename_map.get(spec.lower())
 
   build_sets = []
   def add_build_set(bset, add_args):
@@ -79,23 +108,16 @@ def resolve_build_sets(session, target_specifiers):
 
   for spec in target_specifiers:
     spec, add_args = spec.partition('@=')[::2]
-    if spec.lower() in basename_map:
-      [add_build_set(x, add_args) for x in basename_map[spec.lower()]]
+    matches = find_by_basename(spec)
+    if matches:
+      [add_build_set(x, add_args) for x in matches]
       continue
     abs_spec = nr.fs.canonical(spec)
     if abs_spec in session._output_files:
       add_build_set(session._output_files[abs_spec], add_args)
       continue
 
-    name = spec
-    if '@' in name:
-      scope, name = name.partition('@')[::2]
-    else:
-      scope = session.main_module
-    if ':' in name:
-      target_name, op_name = name.partition(':')[::2]
-    else:
-      target_name, op_name = name, None
+    scope, target_name, op_name = parse_target_specifier(spec, session.main_module)
 
     # Find the target with the exact name and subtargets.
     full_name = scope + '@' + target_name
@@ -110,9 +132,14 @@ def resolve_build_sets(session, target_specifiers):
 
     # Find all matching operators and add their build sets.
     found_sets = False
+    op_prefix = (op_name or '') + '#'
     for target in targets:
       for op in target.operators:
-        if (not op_name and not op.explicit) or op.name.partition('#')[0] == op_name:
+        if op_name:
+          matches = op.name == op_name or op.name.startswith(op_prefix)
+        else:
+          matches = not op.explicit
+        if matches:
           found_sets = True
           [add_build_set(x, add_args) for x in op.build_sets]
 
@@ -306,7 +333,8 @@ def main(argv=None, prog=None):
     args.pywarn = args.pywarn or 'once'
     warnings.simplefilter(args.pywarn)
 
-  if args.notify and not ntfy:
+  if args.notify and not import_ntfy():
+    args.notify = False
     print('warning: ntfy module is not available, --notify is ignored.')
 
   if nr.fs.isdir(args.project):
@@ -421,11 +449,13 @@ def main(argv=None, prog=None):
     return 0
 
   if args.dump_graphviz is not NotImplemented:
+    from craftr.core.build import to_graph
     with open_cli_file(args.dump_graphviz, 'w') as fp:
       to_graph(session).render(fp)
     return 0
 
   if args.dump_svg is not NotImplemented:
+    from craftr.core.build import to_graph
     dotstr = to_graph(session).render().encode('utf8')
     with open_cli_file(args.dump_svg, 'w') as fp:
       command = [os.environ.get('DOTENGINE', 'dot'), '-T', 'svg']
@@ -439,12 +469,15 @@ def main(argv=None, prog=None):
     backend.clean(build_sets, recursive=args.recursive, verbose=args.verbose)
   if args.build:
     res = backend.build(build_sets, verbose=args.verbose, sequential=args.sequential)
-    if args.notify and ntfy:
+    if args.notify:
       notify('Build completed.' if res == 0 else 'Build errored.', 'Craftr')
     sys.exit(res)
 
 
 def show_buildsets_in_console(show, build_sets, main_module):
+  from nr.stream import groupby
+  from termcolor import colored
+
   level = ShowLevels[show]
   build_sets = list(build_sets)
 
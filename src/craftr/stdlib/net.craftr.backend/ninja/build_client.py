@@ -30,7 +30,6 @@ Ninja runs.
 
 import argparse
 import contextlib
-import io
 import json
 import nr.fs as path
 import os
@@ -49,15 +48,18 @@ verbose = os.environ.get('CRAFTR_VERBOSE') == 'true'
 
 
 def recvall(sock, size):
-  buffer = io.BytesIO()
+  buffer = bytearray(size)
+  view = memoryview(buffer)
   bytes_read = 0
   while bytes_read < size:
-    data = sock.recv(size - bytes_read)
-    if not data:
+    count = sock.recv_into(view[bytes_read:])
+    if not count:
       break
-    buffer.write(data)
-    bytes_read += len(data)
-  return buffer.getvalue()
+    bytes_read += count
+  del view
+  if bytes_read < size:
+    del buffer[bytes_read:]
+  return buffer
 
 
 class BuildClient:
@@ -84,9 +86,8 @@ class BuildClient:
 
   def _send_receive(self, request):
     request = json.dumps(request).encode('utf8')
-    self._client.sendall(struct.pack('!I', len(request)))
-    self._client.sendall(request)
-    response_size = struct.unpack('!I', self._client.recv(4))[0]
+    self._client.sendall(struct.pack('!I', len(request)) + request)
+    response_size = struct.unpack('!I', recvall(self._client, 4))[0]
     response_data = recvall(self._client, response_size).decode('utf8')
     response = json.loads(response_data)
     if 'error' in response:
@@ -140,6 +141,7 @@ def main(argv=None, prog=None):
     d = path.dir(f)
     if d not in created_dirs:
       path.makedirs(d)
+      created_dirs.add(d)
 
   # Update the environment and working directory.
   os.environ.update(bset.get_environ())
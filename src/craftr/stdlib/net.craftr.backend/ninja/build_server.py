@@ -52,7 +52,7 @@ class JsonifyProxy:
     return self._obj.to_json(*args, **kwargs)
 
 
-class RequestHandler(socketserver.BaseRequestHandler):
+class RequestHandler(socketserver.StreamRequestHandler):
 
   master = None
   additional_args = None
@@ -60,10 +60,12 @@ class RequestHandler(socketserver.BaseRequestHandler):
   def handle(self):
     try:
       while True:
-        data = self.request.recv(4)
-        if len(data) == 0: break
+        # Read through the buffered rfile, a single recv() may return
+        # less than the requested number of bytes.
+        data = self.rfile.read(4)
+        if len(data) < 4: break
         request_size = struct.unpack('!I', data)[0]
-        request = json.loads(self.request.recv(request_size).decode('utf8'))
+        request = json.loads(self.rfile.read(request_size).decode('utf8'))
 
         if 'reload_build_server' in request:
           self.master.reload()
@@ -87,11 +89,11 @@ class RequestHandler(socketserver.BaseRequestHandler):
             }
             response = {'data': data}
 
+        # Send the size and payload in one go to avoid a small packet
+        # that would be delayed by Nagle's algorithm.
         response = json.dumps(response).encode('utf8')
-        self.request.sendall(struct.pack('!I', len(response)))
-        self.request.sendall(response)
+        self.request.sendall(struct.pack('!I', len(response)) + response)
 
-      self.request.close()
     except ConnectionResetError:
       pass
 
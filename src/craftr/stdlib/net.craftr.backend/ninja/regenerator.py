@@ -10,9 +10,63 @@ inputs = sys.argv[idx_inputs+1:idx_outputs]
 outputs = sys.argv[idx_outputs+1:idx_command]
 command = sys.argv[idx_command+1:]
 
+
+def get_mtimes(files):
+  """
+  Returns a dictionary that maps every filename in *files* to its
+  modification time in nanoseconds, or None if the file does not exist.
+  Files are grouped by their parent directory so that every directory
+  is scanned only once instead of issuing one stat() per file.
+  """
+
+  by_dir = {}
+  for filename in files:
+    dirname, basename = os.path.split(filename)
+    by_dir.setdefault(dirname, {})[os.path.normcase(basename)] = filename
+
+  def scan(item):
+    dirname, names = item
+    found = []
+    try:
+      entries = os.scandir(dirname or '.')
+    except FileNotFoundError:
+      return found
+    with entries:
+      for entry in entries:
+        filename = names.get(os.path.normcase(entry.name))
+        if filename is not None:
+          found.append((filename, entry.stat().st_mtime_ns))
+    return found
+
+  result = dict.fromkeys(files)
+  if len(by_dir) > 1:
+    # The build scripts are spread over many directories, scan them in
+    # parallel as this is bound by syscall latency rather than CPU.
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(16, len(by_dir))) as executor:
+      scanned = list(executor.map(scan, by_dir.items()))
+  else:
+    scanned = [scan(x) for x in by_dir.items()]
+  for found in scanned:
+    result.update(found)
+  return result
+
+
+def is_dirty(inputs, outputs):
+  if not outputs:
+    return True  # no output, always dirty
+  mtimes = get_mtimes(inputs + outputs)
+  output_mtimes = [mtimes[x] for x in outputs]
+  if None in output_mtimes:
+    return True  # output does not exist
+  input_mtimes = [mtimes[x] for x in inputs]
+  if None in input_mtimes:
+    return True  # let the command report the missing input
+  return bool(input_mtimes) and max(input_mtimes) > min(output_mtimes)
+
+
 # Check if the files are actually dirty.
-import nr.fs
-if nr.fs.compare_all_timestamps(inputs, outputs):
+if is_dirty(inputs, outputs):
   import subprocess
   sys.exit(subprocess.call(command))
 else:
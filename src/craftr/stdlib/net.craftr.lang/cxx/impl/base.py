@@ -1,6 +1,8 @@
 
 import {options} from '../build.craftr'
+import functools
 import nr.fs
+import shutil
 
 from craftr.api import *
 from craftr.core import build
@@ -52,6 +54,32 @@ def is_staticlib(data):
   return data.type == 'library' and data.preferredLinkage == 'static'
 
 
+@functools.lru_cache()
+def get_compiler_launcher():
+  """
+  Returns the compiler launcher (eg. ccache or sccache) configured with the
+  `cxx.compilerLauncher` option as a list, or an empty list. With the value
+  `auto`, sccache or ccache is used if either is available.
+  """
+
+  launcher = options.compilerLauncher
+  if launcher == 'auto':
+    launcher = shutil.which('sccache') or shutil.which('ccache') or ''
+  return [launcher] if launcher else []
+
+
+@functools.lru_cache(maxsize=None)
+def _split_template(args):
+  """
+  Splits every element of the flag template *args* (a tuple of strings) at
+  its `%ARG%` placeholders. Elements without a placeholder are returned
+  unchanged. The compiler flag templates are fixed, so this is only done
+  once per template instead of for every expanded value.
+  """
+
+  return tuple(tuple(x.split('%ARG%')) if '%ARG%' in x else x for x in args)
+
+
 class Compiler(Struct):
   """
   Represents the flags necessary to support the compilation and linking with
@@ -115,6 +143,10 @@ class Compiler(Struct):
     ('compiler_enable_openmp', List[str], None),
     ('linker_enable_openmp', List[str], None),
 
+    # Link-time optimization, only used for release builds.
+    ('compiler_lto', List[str], []),
+    ('linker_lto', List[str], []),
+
     ('linker_c', List[str]),                 # Arguments to invoke the linker for C programs.
     ('linker_cpp', List[str]),               # Arguments to invoke the linker for C++/C programs.
     ('linker_env', Dict[str, str]),          # Environment variables for the binary linker.
@@ -161,10 +193,11 @@ class Compiler(Struct):
 
   def expand(self, args, value=None):
     if isinstance(args, str):
-      args = [args]
-    if value is not None:
-      return [x.replace('%ARG%', value) for x in args]
-    return list(args)
+      args = (args,)
+    if value is None:
+      return list(args)
+    return [x if isinstance(x, str) else value.join(x)
+            for x in _split_template(tuple(args))]
 
   # @override
   def init(self):
@@ -233,7 +266,7 @@ class Compiler(Struct):
       else:
         flags += self.compiler_enable_openmp
 
-    command = self.expand(getattr(self, 'compiler_' + lang))
+    command = get_compiler_launcher() + self.expand(getattr(self, 'compiler_' + lang))
     command.append('${<src}')
     command.extend(self.expand(self.compiler_out, '${@obj}'))
 
@@ -267,6 +300,8 @@ class Compiler(Struct):
     command.extend(self.expand(self.enable_rtti if data.enableRtti else self.disable_rtti))
     if not BUILD.debug:
       command += self.expand(getattr(self, 'optimize_' + (data.optimization or 'best') + '_flag'))
+      if options.lto:
+        command += self.expand(self.compiler_lto)
     if BUILD.debug:
       command += self.expand(self.debug_flag)
     if forced_includes:
@@ -283,12 +318,12 @@ class Compiler(Struct):
                   deps_prefix=self.deps_prefix)
 
     objdir = path.join(target.build_directory, 'obj')
+    depfile = TemplateCompiler().compile(self.depfile_name) if self.depfile_name else None
     for src in srcs:
       bset = BuildSet({'src': src}, {})
       self.add_objects_for_source(target, data, lang, src, bset, objdir)
-      obj_file = bset.outputs['obj'][0]
-      if self.depfile_name:
-        bset.depfile = TemplateCompiler().compile(self.depfile_name).render({}, {'obj': [obj_file]}, {})[0]
+      if depfile:
+        bset.depfile = depfile.render({}, {'obj': bset.outputs['obj'][:1]}, {})[0]
       op.add_build_set(bset)
 
     return op
@@ -297,8 +332,7 @@ class Compiler(Struct):
     """
     This method is called from #create_compile_action() in order to construct
     the object output filename for the specified C or C++ source file and add
-    it to the *buildset*. Additional files may also be added, for example the
-    MSVC compiler will add the PDB file.
+    it to the *buildset*. Additional files may also be added.
 
     The object file must be tagged as `out` and `obj`. Additional output files
     should be tagged with at least `out` and maybe `optional`.
@@ -351,6 +385,9 @@ class Compiler(Struct):
     if data.enableOpenmp and self.compiler_supports_openmp and not is_staticlib(data):
       flags += self.linker_enable_openmp
 
+    if options.lto and not BUILD.debug and not is_staticlib(data):
+      flags += self.expand(self.linker_lto)
+
     libs = data.systemLibraries
 
     if not is_staticlib(data):
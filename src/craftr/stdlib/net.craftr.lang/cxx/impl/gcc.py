@@ -60,6 +60,10 @@ class GccCompiler(base.Compiler):
   compiler_enable_openmp = ['-fopenmp']
   linker_enable_openmp = ['-lgomp']
 
+  # Run the link-time optimization in parallel (requires GCC 10+).
+  compiler_lto = ['-flto=auto']
+  linker_lto = ['-flto=auto']
+
   linker_c = ['gcc']
   linker_cpp = ['g++']
   linker_env = None
@@ -88,19 +92,25 @@ class GccCompiler(base.Compiler):
     if OS.id == 'darwin':
       session.target_props.add('cxx.osxInstallNameTool', 'StringList')
 
-  def get_compile_command(self, target, data, lang):
-    flags = super().get_compile_command(target, data, lang)
+    # The options don't change after the compiler is initialized, so we
+    # can resolve the additional flags once instead of for every target.
+    self._extra_compile_flags = []
+    self._extra_shared_link_flags = []
     if options.enableGcov:
-      flags += ['-fprofile-arcs', '-ftest-coverage']
+      self._extra_compile_flags += ['-fprofile-arcs', '-ftest-coverage']
+      self._extra_shared_link_flags += ['-lgcov']
     if OS.id == 'darwin' and options.minversion:
-      flags += ['-mmacos-version-min=' + options.minversion]
+      self._extra_compile_flags += ['-mmacos-version-min=' + options.minversion]
+
+  def get_compile_command(self, target, data, lang):
+    flags = super().get_compile_command(target, data, lang)
+    flags += self._extra_compile_flags
     return flags
 
   def get_link_command(self, target, data, lang):
     flags = super().get_link_command(target, data, lang)
     if data.preferredLinkage == 'shared':
-      if options.enableGcov:
-        flags += ['-lgcov']
+      flags += self._extra_shared_link_flags
       if data.defaultSystemLibraries and OS.id == 'linux':
         flags += ['-lm', '-lpthread']
     return flags
@@ -16,6 +16,10 @@ class LlvmCompiler(GccCompiler):
   linker_c = compiler_c
   linker_cpp = compiler_cpp
 
+  # ThinLTO optimizes the modules in parallel.
+  compiler_lto = ['-flto=thin']
+  linker_lto = ['-flto=thin']
+
 
 def get_compiler(fragment):
   if OS.id == 'win32':
@@ -56,9 +56,7 @@ class MsvcCompiler(base.Compiler):
   force_include = ['/FI', '%ARG%']
   save_temps = ['/P', '/Fi$out.i']  # TODO: Prevents the compilation step. :(
 
-  compiler_supports_openmp = True
-  compiler_enable_openmp = lambda: lambda self: ['-Xclang', '-fopenmp'] if self.is_clang_cl else ['/openmp']
-  linker_enable_openmp = lambda: lambda self: ['libiomp5md.lib'] if self.is_clang_cl else []
+  compiler_supports_openmp = True  # flags depend on Clang-CL, see __init__()
 
   #linker_c = ['link', '/nologo']
   #linker_cpp = linker_c
@@ -79,6 +77,7 @@ class MsvcCompiler(base.Compiler):
       name = 'LLVM Clang-CL'
     else:
       name = toolkit.type
+    is_clang_cl = 'clang' in name.lower()
     super().__init__(
       name = name,
       compiler_c = [toolkit.cl_bin, '/nologo'],
@@ -91,15 +90,14 @@ class MsvcCompiler(base.Compiler):
       compiler_env = toolkit.environ,
       linker_env = toolkit.environ,
       archiver_env = toolkit.environ,
-      deps_prefix = toolkit.deps_prefix
+      deps_prefix = toolkit.deps_prefix,
+      compiler_enable_openmp = ['-Xclang', '-fopenmp'] if is_clang_cl else ['/openmp'],
+      linker_enable_openmp = ['libiomp5md.lib'] if is_clang_cl else [],
+      compiler_lto = ['-flto=thin'] if is_clang_cl else ['/GL'],
+      linker_lto = [] if is_clang_cl else ['/LTCG:INCREMENTAL']
     )
     self.toolkit = toolkit
-    self.is_clang_cl = 'clang' in self.name.lower()
-
-    for key in self.__fields__:
-      value = getattr(self, key)
-      if callable(value):
-        setattr(self, key, value(self))
+    self.is_clang_cl = is_clang_cl
 
   def info_string(self):
     return '{} v{version} ({id}) {cl_version} for {arch}'.format(
@@ -120,6 +118,16 @@ class MsvcCompiler(base.Compiler):
     props.add('cxx.msvcConformance', 'StringList', options={'inherit': True})
     props.add('cxx.outMsvcResourceFiles', 'PathList')
 
+  def separate_pdb(self, data):
+    """
+    Returns #True if the debug information for *data* is written to a
+    separate program database. Compiler caches can not handle objects that
+    write to a .pdb file, thus /Z7 is used when a compiler launcher is set.
+    """
+
+    return BUILD.debug and data.separateDebugInformation and \
+      not base.get_compiler_launcher()
+
   # @override
   def translate_target(self, target, data):
     src_dir = target.scope.directory
@@ -127,13 +135,29 @@ class MsvcCompiler(base.Compiler):
     if data.msvcResourceFiles:
       outfiles = [chfdir(nr.fs.setsuffix(x, '.res'), obj_dir, src_dir)
                   for x in data.msvcResourceFiles]
-      command = ['rc', '/r', '/nologo', '/fo', '$@out', '$<in']
+      # rc.exe compiles a single script per invocation, so every resource
+      # file gets its own build set. This also allows them to be compiled
+      # in parallel and only when they changed.
+      if self.is_clang_cl:
+        command = ['llvm-rc', '/nologo', '/fo', '$@out', '$<in']
+      else:
+        command = ['rc', '/r', '/nologo', '/fo', '$@out', '$<in']
       operator('cxx.msvcRc', commands=[command], environ=self.compiler_env)
-      build_set({'in': data.msvcResourceFiles}, {'out': outfiles})
+      for infile, outfile in zip(data.msvcResourceFiles, outfiles):
+        build_set({'in': infile}, {'out': outfile})
       properties(target, {'@cxx.outMsvcResourceFiles+': outfiles})
     if base.is_sharedlib(data):
       data.defines += ['_WINDLL']
 
+    # Deduplicate and format these flags once, they are used by the
+    # compile commands of every language and the link command.
+    data._msvcDisableWarningFlags = ['/wd' + str(x) for x in unique(data.msvcDisableWarnings)]
+    data._msvcWarningsAsErrorFlags = ['/we' + str(x) for x in unique(data.msvcWarningsAsErrors)]
+    data._msvcNoDefaultLibFlags = [
+      ('/NODEFAULTLIB:' + x) if x else '/NODEFAULTLIB'
+      for x in unique(data.msvcNoDefaultLib)
+    ]
+
   # @override
   def get_compile_command(self, target, data, lang):
     command = super().get_compile_command(target, data, lang)
@@ -144,14 +168,15 @@ class MsvcCompiler(base.Compiler):
 
     if BUILD.debug:
       command += ['/Od', '/RTC1', '/FC']
-      if not self.version or self.version >= '18':
-        # Enable parallel writes to .pdb files.
-        command += ['/FS']
-      if data.separateDebugInformation:
-        command += ['/Zi', '/Fd${@outPdb}']  # TODO: no .pdb files generated.?
+      if self.separate_pdb(data):
+        # All objects of the target share one program database. /FS
+        # serializes the writes through mspdbsrv, otherwise parallel
+        # compiler invocations can fail with C1041.
+        pdb = path.join(target.build_directory, 'obj', target.name + '.pdb')
+        command += ['/Zi', '/FS', '/Fd' + pdb]
       else:
         command += ['/Z7']
-    command += ['/wd' + str(x) for x in unique(data.msvcDisableWarnings)]
+    command += data._msvcDisableWarningFlags
     command += ['/bigobj']
 
     if not data.runtimeLibrary:
@@ -163,7 +188,7 @@ class MsvcCompiler(base.Compiler):
     else:
       error('invalid cxx.runtimeLibrary: {!r}'.format(data.runtimeLibrary))
 
-    command += ['/we' + str(x) for x in unique(data.msvcWarningsAsErrors)]
+    command += data._msvcWarningsAsErrorFlags
     command += data.msvcCompilerFlags
 
     for conf in data.msvcConformance:
@@ -174,24 +199,15 @@ class MsvcCompiler(base.Compiler):
       command += ['/showIncludes']
     return command
 
-  # @override
-  def add_objects_for_source(self, target, data, lang, src, buildset, objdir):
-    super().add_objects_for_source(target, data, lang, src, buildset, objdir)
-    obj = buildset.outputs['obj'][0]
-    if BUILD.debug and data.separateDebugInformation:
-      pdb = path.setsuffix(obj, '.pdb')
-      buildset.add_output_files('outPdb', [pdb])
-
   # @override
   def get_link_command(self, target, data, lang):
     command = super().get_link_command(target, data, lang)
-    command += [
-      ('/NODEFAULTLIB:' + x) if x else '/NODEFAULTLIB'
-      for x in unique(data.msvcNoDefaultLib)
-    ]
+    command += data._msvcNoDefaultLibFlags
     if base.is_sharedlib(data):
       command += ['/IMPLIB:${@outImplib}']  # set from add_link_outputs()
-    if BUILD.debug and base.is_sharedlib(data):
+    if BUILD.debug and not base.is_staticlib(data):
+      # Also produces the program database from the debug information that
+      # /Z7 embedds in the object files.
       command += ['/DEBUG']
     return command
 
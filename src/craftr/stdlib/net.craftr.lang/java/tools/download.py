@@ -24,6 +24,7 @@
 import argparse
 import os
 import requests
+import shutil
 import sys
 
 parser = argparse.ArgumentParser()
@@ -46,9 +47,9 @@ def main(argv=None):
   except requests.RequestException as e:
     print(e, file=sys.stderr)
     return 1
-  with open(args.to, 'wb') as fp:
-    for chunk in response.iter_content(2048):
-      fp.write(chunk)
+  with response, open(args.to, 'wb') as fp:
+    response.raw.decode_content = True
+    shutil.copyfileobj(response.raw, fp, 1 << 20)
   return 0
 
 
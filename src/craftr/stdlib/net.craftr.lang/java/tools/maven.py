@@ -27,12 +27,18 @@ Access maven artifacts.
 
 from xml.etree import ElementTree
 import xml.dom.minidom as minidom
+import os
 import requests
+import shutil
 
 import logging as log # TODO
 
+# Reuse connections to the repositories, a build usually fetches a lot of
+# small POM files from the same hosts.
+_http = requests.Session()
+
 def requests_get_check(*args, **kwargs):
-  response = requests.get(*args, **kwargs)
+  response = _http.get(*args, **kwargs)
   response.raise_for_status()
   return response
 
@@ -101,9 +107,10 @@ class Artifact:
 
 class MavenRepository:
 
-  def __init__(self, name, uri):
+  def __init__(self, name, uri, cache_dir=None):
     self.name = name
     self.uri = uri.rstrip('/')
+    self.cache_dir = cache_dir
     self.pom_cache = {}
     self.pom_not_found = set()
     self.metadata_cache = {}
@@ -118,9 +125,10 @@ class MavenRepository:
 
     url = self.get_artifact_uri(artifact, 'jar')
     log.info('[Downloading] JAR from {}'.format(url))
-    with open(local_path, 'wb') as fp:
-      for chunk in requests_get_check(url).iter_content():
-        fp.write(chunk)
+    with requests_get_check(url, stream=True) as response:
+      response.raw.decode_content = True
+      with open(local_path, 'wb') as fp:
+        shutil.copyfileobj(response.raw, fp, 1 << 20)
 
   def download_pom(self, artifact):
     """
@@ -139,7 +147,7 @@ class MavenRepository:
         metadata = self.metadata_cache[artifact]
       else:
         metadata_path = self.uri + '/' + artifact.to_maven_metadata()
-        response = requests.get(metadata_path)
+        response = _http.get(metadata_path)
         if response.status_code != 200:
           return None
         metadata = minidom.parseString(response.content)
@@ -155,11 +163,30 @@ class MavenRepository:
       if snapshot_info is not None:
         artifact.timestamp, artifact.build_number = snapshot_info
 
+    # Released POMs never change, so they can be kept on disk between
+    # invocations. Snapshots must always be checked against the repository.
+    cache_file = None
+    if self.cache_dir and not artifact.is_snapshot():
+      cache_file = os.path.join(self.cache_dir, self.name, artifact.to_maven_name('pom'))
+      try:
+        with open(cache_file, encoding='utf8') as fp:
+          data = fp.read()
+      except FileNotFoundError:
+        pass
+      else:
+        self.pom_cache[artifact] = data
+        return data
+
     url = self.get_artifact_uri(artifact, 'pom')
     try:
       log.info('[Checking] POM file {}'.format(url))
       data = requests_get_check(url).text
       self.pom_cache[artifact] = data
+      if cache_file:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file + '.tmp', 'w', encoding='utf8') as fp:
+          fp.write(data)
+        os.replace(cache_file + '.tmp', cache_file)
       return data
     except requests.exceptions.RequestException:
       self.pom_not_found.add(artifact)
@@ -205,7 +205,7 @@ def main(argv=None, prog=None):
   for f in args.files:
     f, s = f.partition('=')[::2]
     if not s:
-      s = re.sub('[^\w\d_]+', '_', os.path.basename(f))
+      s = re.sub(r'[^\w\d_]+', '_', os.path.basename(f))
     files[f] = s
 
   if args.h:
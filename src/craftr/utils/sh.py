@@ -22,13 +22,17 @@
 # SOFTWARE.
 
 import contextlib
+import functools
 import os
 import re
 import shlex
+import shutil
 
-from shutil import which
 from subprocess import PIPE, STDOUT, DEVNULL, call, check_call, check_output, run, CalledProcessError
 
+_NEEDS_QUOTES_RE = re.compile(r'[\s<>]')
+_NINJA_VAR_RE = re.compile(r"'(\$\w+)'")
+
 
 class safe(str):
   """
@@ -63,16 +67,33 @@ def quote(s, for_ninja=False):
     return s
   if os.name == 'nt' and os.sep == '\\':
     s = s.replace('"', '\\"')
-    if re.search(r'\s', s) or any(c in s for c in '<>'):
+    if _NEEDS_QUOTES_RE.search(s):
       s = '"' + s + '"'
   else:
     s = shlex.quote(s)
-  if for_ninja:
+  if for_ninja and '$' in s:
     # Fix escaped $ variables on Unix, see issue craftr-build/craftr#30
-    s = re.sub(r"'(\$\w+)'", r'\1', s)
+    s = _NINJA_VAR_RE.sub(r'\1', s)
   return s
 
 
+@functools.lru_cache()
+def _which(cmd, mode, path, pathext):
+  return shutil.which(cmd, mode, path)
+
+
+def which(cmd, mode=os.F_OK | os.X_OK, path=None):
+  """
+  Cached version of #shutil.which(). The cache key includes the search
+  *path* (defaults to the current `PATH` environment variable) so that
+  lookups inside #override_environ() are resolved correctly.
+  """
+
+  if path is None:
+    path = os.environ.get('PATH', os.defpath)
+  return _which(cmd, mode, path, os.environ.get('PATHEXT'))
+
+
 def join(args):
   return ' '.join(map(quote, args))
 
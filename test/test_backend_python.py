@@ -0,0 +1,62 @@
+# -*- coding: utf8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2018  Niklas Rosenstein
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import pytest
+import subprocess
+import sys
+import textwrap
+
+import craftr
+
+
+def run_craftr(project_dir, *args):
+  env = os.environ.copy()
+  env['PYTHONPATH'] = os.path.dirname(os.path.dirname(craftr.__file__))
+  return subprocess.run([sys.executable, '-m', 'craftr.main', *args],
+    cwd=str(project_dir), env=env, stdout=subprocess.PIPE,
+    stderr=subprocess.STDOUT, universal_newlines=True)
+
+
+def test_operator_path_environ(tmpdir):
+  # The program is only found through the PATH of the operator's environ.
+  bin_dir = tmpdir.mkdir('bin')
+  if os.name == 'nt':
+    bin_dir.join('mytool.bat').write('@echo %* > %1\n')
+  else:
+    script = bin_dir.join('mytool')
+    script.write('#!/bin/sh\necho "$@" > "$1"\n')
+    script.chmod(0o755)
+  tmpdir.join('build.craftr').write(textwrap.dedent('''
+    import * from 'craftr'
+    project('test', '1.0')
+    import os
+    target('main')
+    operator('run', commands=[['mytool', '$@out']],
+      environ={'PATH': path.canonical('bin') + os.pathsep + os.environ['PATH']})
+    build_set({}, {'out': 'result.txt'})
+  '''))
+
+  proc = run_craftr(tmpdir, '--backend', 'python', '-c', '-b')
+  assert proc.returncode == 0, proc.stdout
+  assert tmpdir.join('result.txt').read().strip() == str(tmpdir.join('result.txt'))
@@ -0,0 +1,65 @@
+# -*- coding: utf8 -*-
+# The MIT License (MIT)
+#
+# Copyright (c) 2018  Niklas Rosenstein
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from craftr.core.build import Master, Target, Operator, BuildSet, Commands, critical_path
+
+
+class TestCriticalPath:
+
+  def make_graph(self, edges):
+    """
+    Creates a build set for every name in *edges*, which maps the name of
+    a build set to the names of the build sets it takes its inputs from.
+    """
+
+    master = Master()
+    target = master.add_target(Target(master, 'scope@target'))
+    operator = target.add_operator(Operator(master, 'op', Commands([['cmd']])))
+    build_sets = {}
+    for name, deps in edges.items():
+      bset = BuildSet(master)
+      bset.add_input_files('in', [x + '.out' for x in deps])
+      bset.add_output_files('out', [name + '.out'])
+      operator.add_build_set(bset)
+      build_sets[name] = bset
+    return master, build_sets
+
+  def test_chain(self):
+    master, b = self.make_graph({'a': [], 'b': ['a'], 'c': ['b']})
+    result = critical_path(master)
+    assert result == {b['a']: 3, b['b']: 2, b['c']: 1}
+
+  def test_diamond(self):
+    master, b = self.make_graph({'a': [], 'b': ['a'], 'c': ['a'], 'd': ['b', 'c']})
+    costs = {b['a']: 1, b['b']: 5, b['c']: 2, b['d']: 1}
+    result = critical_path(master, costs.__getitem__)
+    assert result == {b['a']: 7, b['b']: 6, b['c']: 3, b['d']: 1}
+
+  def test_default_cost(self):
+    master, b = self.make_graph({'a': [], 'b': ['a'], 'c': ['a'], 'd': ['b', 'c']})
+    result = critical_path(master)
+    assert result == critical_path(master, lambda x: 1)
+    assert result[b['a']] == 3
+    assert result[b['d']] == 1
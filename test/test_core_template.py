@@ -36,3 +36,14 @@ class TestCompiler:
     assert t._parts[1].name == 'prefix'
     assert t._parts[2].type == '<'
     assert t._parts[2].name == 'srcs'
+
+  def test_render_list(self):
+    t = TemplateCompiler().compile_list(['gcc', '-c', '$<in', '-o', '$@out', '$flags', '-D$define'])
+    inputs = {'in': ['a.c', 'b.c']}
+    outputs = {'out': ['a.o']}
+    variables = {'flags': ['-O2', '-g'], 'define': 'NDEBUG'}
+    assert t.render(inputs, outputs, variables) == [
+      'gcc', '-c', 'a.c', 'b.c', '-o', 'a.o', '-O2', '-g', '-DNDEBUG']
+    result = t.render(inputs, outputs, variables)
+    result.append('-v')
+    assert t.render(inputs, outputs, variables)[-1] == '-DNDEBUG'